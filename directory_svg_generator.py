@@ -1,9 +1,12 @@
 import os
-import argparse
-from pathlib import Path
 import hashlib
+import html
 import math
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 
 # Global configuration parameters
 NODE_WIDTH = 220
@@ -17,6 +20,46 @@ MAX_COLOR = (200, 0, 0)  # Red
 CONNECTOR_COLOR = "#AAAAAA"
 TEXT_COLOR = "#FFFFFF"
 BG_COLOR = "#2A2A2A"
+# Whether directories can be scanned through a file descriptor (POSIX)
+SCANDIR_FD = os.scandir in os.supports_fd
+
+def pack_rgb(color):
+    return (int(color[0]) << 16) | (int(color[1]) << 8) | int(color[2])
+
+def _js_number(value):
+    # Formats a number the way JS template literals do (10.0 -> "10")
+    return str(int(value)) if value == int(value) else repr(float(value))
+
+# Directory sizes repeat a lot (empty and near-identical folders), so both
+# helpers are cached; they take every input explicitly to stay hashable.
+@lru_cache(maxsize=4096)
+def color_for_size(size, min_size, max_size, min_rgb, mid_rgb, max_rgb):
+    # Colors are packed 0xRRGGBB ints blended in 8-bit fixed point; red and
+    # blue share one multiply since their fields never overlap.
+    if max_size <= min_size or min_size == float('inf'):
+        return "#%06x" % mid_rgb  # Yellow
+    f = (size - min_size) * 512 // (max_size - min_size)
+    f = max(0, min(512, f))
+    # Pick the segment's endpoints once; the blend below only ever sees
+    # low/high, so channels can't mix up endpoints between segments.
+    if f <= 256:
+        low, high = min_rgb, mid_rgb
+    else:
+        low, high = mid_rgb, max_rgb
+        f -= 256
+    rb = ((low & 0xFF00FF) * (256 - f) + (high & 0xFF00FF) * f) >> 8
+    g = ((low & 0x00FF00) * (256 - f) + (high & 0x00FF00) * f) >> 8
+    return "#%06x" % ((rb & 0xFF00FF) | (g & 0x00FF00))
+
+@lru_cache(maxsize=4096)
+def format_size(size_bytes):
+    if size_bytes == 0:
+        return "0 B"
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    i = int(math.floor(math.log(size_bytes, 1024)))
+    p = math.pow(1024, i)
+    s = round(size_bytes / p, 2)
+    return f"{s} {size_names[i]}"
 
 class DirectorySVGGenerator:
     def __init__(self, root_dir):
@@ -34,6 +77,9 @@ class DirectorySVGGenerator:
         self.min_color = MIN_COLOR
         self.mid_color = MID_COLOR
         self.max_color = MAX_COLOR
+        self.min_rgb = pack_rgb(MIN_COLOR)
+        self.mid_rgb = pack_rgb(MID_COLOR)
+        self.max_rgb = pack_rgb(MAX_COLOR)
         self.connector_color = CONNECTOR_COLOR
         self.text_color = TEXT_COLOR
         self.bg_color = BG_COLOR
@@ -43,170 +89,272 @@ class DirectorySVGGenerator:
         self.max_height = 0
         self.max_dir_size = 1
         self.min_dir_size = float('inf')
+        self.visited_dirs = set()
+        self.visited_lock = threading.Lock()
 
-    def calculate_dir_size(self, directory):
+    def _scan_entries(self, node_data):
+        # Sums the files directly inside node_data's directory and returns
+        # nodes for its subdirectories, sorted by name. Only DirEntry data is
+        # used, so there is no extra stat/join per entry. Directories already
+        # seen by (device, inode) are skipped so bind-mount loops can't recurse.
+        # Where supported the directory is scanned through an open fd, making
+        # each DirEntry.stat() an fstatat() relative to it rather than a full
+        # path lookup.
+        path = node_data['path']
         total_size = 0
+        subdirs = []
+        visited_dirs = self.visited_dirs
+        visited_lock = self.visited_lock
+        dir_fd = None
         try:
-            for dirpath, dirnames, filenames in os.walk(directory):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
+            if SCANDIR_FD:
+                dir_fd = os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+            with os.scandir(path if dir_fd is None else dir_fd) as it:
+                for entry in it:
                     try:
-                        total_size += os.path.getsize(file_path)
-                    except (FileNotFoundError, PermissionError):
+                        if entry.is_dir(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            if not st.st_ino:
+                                # DirEntry.stat() leaves st_dev/st_ino zero on
+                                # Windows; only a full stat fills them in. With
+                                # an fd scan entry.path is relative to dir_fd.
+                                st = os.stat(entry.path, dir_fd=dir_fd, follow_symlinks=False)
+                            if st.st_ino:
+                                key = (st.st_dev, st.st_ino)
+                                with visited_lock:
+                                    if key in visited_dirs:
+                                        continue
+                                    visited_dirs.add(key)
+                            subdirs.append(entry)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
                         pass
-        except (PermissionError, FileNotFoundError):
-            return 0
-        return total_size
+        except OSError:
+            pass
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        node_data['size'] = total_size
+        subdirs.sort(key=attrgetter('name'))
+        dir_id = node_data['id']
+        generate_id = self._generate_id
+        prefix = os.path.join(path, '')
+        children = []
+        for entry in subdirs:
+            child_path = prefix + entry.name
+            children.append({
+                'id': generate_id(child_path),
+                'name': entry.name,
+                'path': child_path,
+                'size': 0,
+                'children': [],
+                'parent': dir_id
+            })
+        return children
+
+    def _scan_subtree(self, top_node):
+        # Iterative post-order walk of one subtree. Each stack entry is
+        # (node, parent node, phase): phase 0 scans the directory, phase 1 runs
+        # after its subtree and rolls its size up. Results are collected
+        # locally so subtrees can be scanned concurrently and merged after.
+        subtree = {top_node['id']: top_node}
+        subtree_sizes = {}
+        local_min = float('inf')
+        local_max = 0
+        scan_entries = self._scan_entries
+        stack = [(top_node, None, 0)]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            node_data, parent, phase = pop()
+            if phase:
+                dir_size = node_data['size']
+                subtree_sizes[node_data['path']] = dir_size
+                if 0 < dir_size < local_min:
+                    local_min = dir_size
+                if dir_size > local_max:
+                    local_max = dir_size
+                if parent is not None:
+                    parent['size'] += dir_size
+                    parent['children'].append(node_data['id'])
+                continue
+            children = scan_entries(node_data)
+            push((node_data, parent, 1))
+            for child in reversed(children):
+                subtree[child['id']] = child
+                push((child, node_data, 0))
+        return subtree, subtree_sizes, local_min, local_max
 
-    def scan_directory_sizes(self, directory=None):
-        if directory is None:
-            directory = self.root_dir
+    def _scan_and_build(self, root):
+        # Sizes directories and builds their tree nodes in one walk; colors
+        # are assigned later once min/max are known. The root's subdirectories
+        # are scanned in parallel since the work is dominated by syscalls,
+        # which release the GIL.
+        root_node = {
+            'id': self._generate_id(root),
+            'name': os.path.basename(root),
+            'path': root,
+            'size': 0,
+            'children': [],
+            'parent': None
+        }
+        self.directory_tree[root_node['id']] = root_node
+        self.visited_dirs.clear()
         try:
-            subdirs = [os.path.join(directory, item) for item in os.listdir(directory) 
-                       if os.path.isdir(os.path.join(directory, item))]
-        except (PermissionError, FileNotFoundError):
-            return
-        dir_size = self.calculate_dir_size(directory)
-        self.dir_sizes[directory] = dir_size
-        if dir_size > 0:
-            self.min_dir_size = min(self.min_dir_size, dir_size)
-        self.max_dir_size = max(self.max_dir_size, dir_size)
-        for subdir in subdirs:
-            self.scan_directory_sizes(subdir)
+            st = os.stat(root)
+            self.visited_dirs.add((st.st_dev, st.st_ino))
+        except OSError:
+            pass
+        children = self._scan_entries(root_node)
+        if children:
+            max_workers = (os.cpu_count() or 1) * 2
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._scan_subtree, children))
+            for child, (subtree, subtree_sizes, local_min, local_max) in zip(children, results):
+                self.directory_tree.update(subtree)
+                self.dir_sizes.update(subtree_sizes)
+                self.min_dir_size = min(self.min_dir_size, local_min)
+                self.max_dir_size = max(self.max_dir_size, local_max)
+                root_node['size'] += child['size']
+                root_node['children'].append(child['id'])
+        root_size = root_node['size']
+        self.dir_sizes[root] = root_size
+        if root_size > 0:
+            self.min_dir_size = min(self.min_dir_size, root_size)
+        self.max_dir_size = max(self.max_dir_size, root_size)
 
     def get_color_for_size(self, size):
-        if self.max_dir_size <= self.min_dir_size or self.min_dir_size == float('inf'):
-            return f"#{int(self.mid_color[0]):02x}{int(self.mid_color[1]):02x}{int(self.mid_color[2]):02x}"  # Yellow
-        normalized_size = (size - self.min_dir_size) / (self.max_dir_size - self.min_dir_size)
-        normalized_size = max(0, min(1, normalized_size))
-        if normalized_size <= 0.5:
-            factor = normalized_size * 2
-            r = int(self.min_color[0] + factor * (self.mid_color[0] - self.min_color[0]))
-            g = int(self.min_color[1] + factor * (self.mid_color[1] - self.min_color[1]))
-            b = int(self.min_color[2] + factor * (self.mid_color[2] - self.min_color[2]))
-        else:
-            factor = (normalized_size - 0.5) * 2
-            r = int(self.mid_color[0] + factor * (self.max_color[0] - self.mid_color[0]))
-            g = int(self.mid_color[1] + factor * (self.max_color[1] - self.mid_color[1]))
-            b = int(self.mid_color[2] + factor * (self.max_color[2] - self.min_color[2]))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return color_for_size(size, self.min_dir_size, self.max_dir_size,
+                              self.min_rgb, self.mid_rgb, self.max_rgb)
 
     def format_size(self, size_bytes):
-        if size_bytes == 0:
-            return "0 B"
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
-        return f"{s} {size_names[i]}"
+        return format_size(size_bytes)
 
-    def build_directory_tree(self, directory=None, parent_id=None):
-        if directory is None:
-            directory = self.root_dir
-        dir_id = self._generate_id(directory)
-        dir_name = os.path.basename(directory)
-        dir_size = self.dir_sizes.get(directory, 0)
-        node_data = {
-            'id': dir_id,
-            'name': dir_name,
-            'path': directory,
-            'size': dir_size,
-            'formatted_size': self.format_size(dir_size),
-            'children': [],
-            'color': self.get_color_for_size(dir_size),
-            'parent': parent_id
-        }
-        self.directory_tree[dir_id] = node_data
-        try:
-            subdirs = sorted([item for item in os.listdir(directory) 
-                              if os.path.isdir(os.path.join(directory, item))])
-            for subdir in subdirs:
-                subdir_path = os.path.join(directory, subdir)
-                subdir_id = self._generate_id(subdir_path)
-                self.build_directory_tree(subdir_path, dir_id)
-                node_data['children'].append(subdir_id)
-        except (PermissionError, FileNotFoundError):
-            pass
-        return dir_id
+    def _render_initial_view(self):
+        # Pre-renders what the page shows on load (root expanded, its children
+        # collapsed) so the browser can paint without running the JS layout.
+        # Mirrors calculateNodePositions(), renderConnections(), renderNodes()
+        # and updateSVGSize() in the page script.
+        root = self.directory_tree[self._generate_id(self.root_dir)]
+        half_height = self.node_height / 2
+        child_x = 45 + self.node_width + self.horizontal_gap
+        visible = [(root, 45, 45)]
+        visible.extend((self.directory_tree[child_id], child_x, (position + 1) * self.vertical_gap + 45)
+                       for position, child_id in enumerate(root['children']))
+        connections = []
+        start_x = 45 + self.node_width
+        start_y = 45 + half_height
+        for child, x, y in visible[1:]:
+            end_y = y + half_height
+            control_x1 = start_x + (x - start_x) * 0.4
+            control_x2 = start_x + (x - start_x) * 0.6
+            connections.append(
+                f'<path data-id="{child["id"]}" d="M {_js_number(start_x)} {_js_number(start_y)} C {_js_number(control_x1)} {_js_number(start_y)}, '
+                f'{_js_number(control_x2)} {_js_number(end_y)}, {_js_number(x)} {_js_number(end_y)}" '
+                f'stroke="{self.connector_color}" stroke-width="2" fill="none" class="connector"/>')
+        nodes = []
+        for node_data, x, y in visible:
+            nodes.append(
+                f'<g class="node" data-id="{node_data["id"]}" transform="translate({x},{y})">'
+                f'<rect width="{self.node_width}" height="{self.node_height}" rx="{self.node_radius}" ry="{self.node_radius}" fill="{self.get_color_for_size(node_data["size"])}"/>'
+                f'<circle cx="15" cy="{_js_number(half_height)}" r="5" fill="#FFD700"/>'
+                f'<text x="30" y="{_js_number(half_height - 5)}" font-family="Arial" font-size="14px" fill="{self.text_color}" class="node-text">{html.escape(node_data["name"])}</text>'
+                f'<text x="30" y="{_js_number(half_height + 15)}" font-family="Arial" font-size="12px" fill="{self.text_color}" class="node-text">{self.format_size(node_data["size"])}</text>')
+            if node_data['children']:
+                toggle = '−' if node_data is root else '+'
+                nodes.append(f'<text x="{self.node_width - 20}" y="{_js_number(half_height + 5)}" font-family="Arial" font-size="18px" fill="{self.text_color}" class="toggle-icon">{toggle}</text>')
+            nodes.append('</g>')
+        width = max(x for _, x, _ in visible) + self.node_width + 100
+        height = max(y for _, _, y in visible) + self.node_height + 150
+        return ''.join(nodes), ''.join(connections), width, height
 
-    def generate_interactive_svg(self):
-        svg_width = 1600
-        svg_height = 1200
-        svg = []
-        svg.append('<!DOCTYPE html>')
-        svg.append('<html>')
-        svg.append('<head>')
-        svg.append('<meta charset="UTF-8">')
-        svg.append('<title>Interactive Directory Structure</title>')
-        svg.append('<style>')
-        svg.append('  body { margin: 0; padding: 0; background-color: #1a1a1a; overflow: auto; }')
-        svg.append('  #svg-container { width: 100%; height: 100vh; overflow: auto; }')
-        svg.append('  svg { display: block; width: 100%; height: auto; }')
-        svg.append('  .node { cursor: pointer; }')
-        svg.append('  .node-text { pointer-events: none; }')
-        svg.append('  .connector { pointer-events: none; }')
-        svg.append('  .toggle-icon { cursor: pointer; fill: #ffffff; }')
-        svg.append('  .controls { position: fixed; top: 10px; right: 20px; background: rgba(0,0,0,0.7); padding: 10px; border-radius: 5px; color: white; }')
-        svg.append('  .zoom-button { background: #444; color: white; border: none; padding: 5px 10px; margin: 0 5px; cursor: pointer; border-radius: 3px; }')
-        svg.append('  input[type="number"], input[type="text"] { background: #444; color: white; border: none; padding: 5px; border-radius: 3px; }')
-        svg.append('  label { margin-right: 5px; }')
-        svg.append('  .legend { margin-top: 10px; }')
-        svg.append('  .legend-bar { width: 150px; height: 20px; background: linear-gradient(to right, #008000, #FFFF00, #C80000); border-radius: 3px; }')
-        svg.append('  .legend-labels { display: flex; justify-content: space-between; font-size: 12px; margin-top: 2px; }')
-        svg.append('</style>')
-        svg.append('</head>')
-        svg.append('<body>')
-        svg.append('<div class="controls">')
-        svg.append('  <button class="zoom-button" id="zoom-in">Zoom In (+)</button>')
-        svg.append('  <button class="zoom-button" id="zoom-out">Zoom Out (-)</button>')
-        svg.append('  <button class="zoom-button" id="zoom-reset">Reset Zoom</button>')
-        svg.append('  <div style="margin-top: 10px;">')
-        svg.append('    <label>Vertical Gap: </label>')
-        svg.append('    <input type="number" id="vertical-gap-input" min="45" max="500" step="5" style="width: 60px;">')
-        svg.append('  </div>')
-        svg.append('  <div style="margin-top: 5px;">')
-        svg.append('    <label>Horizontal Gap: </label>')
-        svg.append('    <input type="number" id="horizontal-gap-input" min="45" max="500" step="5" style="width: 60px;">')
-        svg.append('  </div>')
-        svg.append('  <div style="margin-top: 10px;">')  # Arama kutusu ekleniyor
-        svg.append('    <label>Search: </label>')
-        svg.append('    <input type="text" id="search-input" placeholder="Enter directory name..." style="width: 150px;">')
-        svg.append('  </div>')
-        svg.append('  <div class="legend">')
-        svg.append('    <div class="legend-bar"></div>')
-        svg.append(f'    <div class="legend-labels"><span>Small ({self.format_size(self.min_dir_size)})</span><span>Large ({self.format_size(self.max_dir_size)})</span></div>')
-        svg.append('  </div>')
-        svg.append('</div>')
-        svg.append('<div id="svg-container">')
-        svg.append(f'<svg id="directory-tree" viewBox="0 0 {svg_width} {svg_height}" preserveAspectRatio="xMinYMin meet">')
-        svg.append(f'<rect width="100%" height="100%" fill="{self.bg_color}"/>')
-        svg.append('<g id="diagram">')
-        svg.append('<g id="connections"></g>')
-        svg.append('<g id="nodes"></g>')
-        svg.append('</g>')
-        svg.append('</svg>')
-        svg.append('</div>')
-        svg.append('<script>')
-        svg.append(f'''
+    def generate_interactive_svg(self, f):
+        # Writes the page to the open text file f; the tree JSON is streamed
+        # straight into it rather than built as one large string first.
+        nodes_markup, connections_markup, svg_width, svg_height = self._render_initial_view()
+        template_head = f'''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>Interactive Directory Structure</title>
+<style>
+  body {{ margin: 0; padding: 0; background-color: #1a1a1a; overflow: auto; }}
+  #svg-container {{ width: 100%; height: 100vh; overflow: auto; }}
+  svg {{ display: block; width: 100%; height: auto; }}
+  .node {{ cursor: pointer; }}
+  .node-text {{ pointer-events: none; }}
+  .connector {{ pointer-events: none; }}
+  .toggle-icon {{ cursor: pointer; fill: #ffffff; }}
+  .controls {{ position: fixed; top: 10px; right: 20px; background: rgba(0,0,0,0.7); padding: 10px; border-radius: 5px; color: white; }}
+  .zoom-button {{ background: #444; color: white; border: none; padding: 5px 10px; margin: 0 5px; cursor: pointer; border-radius: 3px; }}
+  input[type="number"], input[type="text"] {{ background: #444; color: white; border: none; padding: 5px; border-radius: 3px; }}
+  label {{ margin-right: 5px; }}
+  .legend {{ margin-top: 10px; }}
+  .legend-bar {{ width: 150px; height: 20px; background: linear-gradient(to right, #008000, #FFFF00, #C80000); border-radius: 3px; }}
+  .legend-labels {{ display: flex; justify-content: space-between; font-size: 12px; margin-top: 2px; }}
+</style>
+</head>
+<body>
+<div class="controls">
+  <button class="zoom-button" id="zoom-in">Zoom In (+)</button>
+  <button class="zoom-button" id="zoom-out">Zoom Out (-)</button>
+  <button class="zoom-button" id="zoom-reset">Reset Zoom</button>
+  <div style="margin-top: 10px;">
+    <label>Vertical Gap: </label>
+    <input type="number" id="vertical-gap-input" min="45" max="500" step="5" style="width: 60px;">
+  </div>
+  <div style="margin-top: 5px;">
+    <label>Horizontal Gap: </label>
+    <input type="number" id="horizontal-gap-input" min="45" max="500" step="5" style="width: 60px;">
+  </div>
+  <div style="margin-top: 10px;">
+    <label>Search: </label>
+    <input type="text" id="search-input" placeholder="Enter directory name..." style="width: 150px;">
+  </div>
+  <div class="legend">
+    <div class="legend-bar"></div>
+    <div class="legend-labels"><span>Small ({self.format_size(self.min_dir_size)})</span><span>Large ({self.format_size(self.max_dir_size)})</span></div>
+  </div>
+</div>
+<div id="svg-container">
+<svg id="directory-tree" viewBox="0 0 {svg_width} {svg_height}" width="{svg_width}" height="{svg_height}" preserveAspectRatio="xMinYMin meet">
+<rect width="100%" height="100%" fill="{self.bg_color}"/>
+<g id="diagram">
+<g id="connections">{connections_markup}</g>
+<g id="nodes">{nodes_markup}</g>
+</g>
+</svg>
+</div>
+<script>
         const nodeWidth = {self.node_width};
         const nodeHeight = {self.node_height};
         const nodeRadius = {self.node_radius};
         let verticalGap = {self.vertical_gap};
         let horizontalGap = {self.horizontal_gap};
-        ''')
-        svg.append('const treeData = ' + json.dumps(self.directory_tree) + ';')
-        svg.append('''
+        const minDirSize = {json.dumps(self.min_dir_size)};
+        const maxDirSize = {json.dumps(self.max_dir_size)};
+        const minColor = {json.dumps(self.min_color)};
+        const midColor = {json.dumps(self.mid_color)};
+        const maxColor = {json.dumps(self.max_color)};
+        const treeData = '''
+        template_tail = ''';
         const svg = document.getElementById('directory-tree');
         const svgContainer = document.getElementById('svg-container');
         const diagram = document.getElementById('diagram');
         const nodesGroup = document.getElementById('nodes');
         const connectionsGroup = document.getElementById('connections');
         const nodeStates = {};
+        const renderedNodes = new Map();        // node id -> its <g class="node">
+        const renderedConnections = new Map();  // child node id -> connector <path>
         let currentZoom = 0.5;
         let zoomIncrement = 0.1;
         let rootId = Object.keys(treeData).find(id => !treeData[id].parent);
         Object.keys(treeData).forEach(id => {
             nodeStates[id] = { expanded: id === rootId, visible: false };
+            treeData[id].color = colorForSize(treeData[id].size);
+            treeData[id].formattedSize = formatSize(treeData[id].size);
+            treeData[id].lowerName = treeData[id].name.toLowerCase();
         });
         if (rootId) {
             nodeStates[rootId].visible = true;
@@ -214,9 +362,16 @@ class DirectorySVGGenerator:
                 nodeStates[childId].visible = true;
             });
         }
-        renderTree();
+        // The initial view is pre-rendered into the SVG, so only the layout is
+        // computed and the existing elements are indexed for later updates
+        calculateNodePositions();
+        indexRenderedElements(0, 0);
         zoomOut();  // İlk yüklenmede zoom out
         svg.addEventListener('wheel', handleWheel);
+        nodesGroup.addEventListener('click', (e) => {
+            const nodeElem = e.target.closest('.node');
+            if (nodeElem) toggleNode(nodeElem.dataset.id, e);
+        });
         document.getElementById('zoom-in').addEventListener('click', () => {
             zoomIn();
         });
@@ -238,11 +393,45 @@ class DirectorySVGGenerator:
             horizontalGap = parseInt(e.target.value) || 300;
             renderTree();
         });
+        let searchTimer;
         document.getElementById('search-input').addEventListener('input', (e) => {
-            const searchTerm = e.target.value.toLowerCase();
-            searchNodes(searchTerm);
-            renderTree();
+            // Debounced so fast typing triggers a single search and render
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => {
+                searchNodes(e.target.value.toLowerCase());
+                renderTree();
+            }, 150);
         });
+        // Mirrors format_size()
+        function formatSize(sizeBytes) {
+            if (sizeBytes === 0) return '0 B';
+            const sizeNames = ['B', 'KB', 'MB', 'GB', 'TB'];
+            const i = Math.floor(Math.log(sizeBytes) / Math.log(1024));
+            const n = sizeBytes / Math.pow(1024, i) * 100;
+            let r = Math.round(n);
+            // Python's round() sends exact halves to the even neighbour
+            if (r - n === 0.5 && r % 2) r -= 1;
+            const s = r / 100;
+            return `${Number.isInteger(s) ? s.toFixed(1) : s} ${sizeNames[i]}`;
+        }
+        // Mirrors color_for_size()
+        function colorForSize(size) {
+            let low = midColor, high = midColor, f = 0;
+            if (maxDirSize > minDirSize && minDirSize !== Infinity) {
+                f = Math.max(0, Math.min(512, Math.floor((size - minDirSize) * 512 / (maxDirSize - minDirSize))));
+                if (f <= 256) {
+                    low = minColor;
+                } else {
+                    high = maxColor;
+                    f -= 256;
+                }
+            }
+            let color = '#';
+            for (let c = 0; c < 3; c++) {
+                color += ((low[c] * (256 - f) + high[c] * f) >> 8).toString(16).padStart(2, '0');
+            }
+            return color;
+        }
         function zoomIn() {
             currentZoom += zoomIncrement;
             updateZoom();
@@ -267,18 +456,14 @@ class DirectorySVGGenerator:
                 container.scrollTop += scrollSpeed;
             }
         }
-        function updateSVGSize() {
-            const nodes = document.querySelectorAll('.node');
-            if (nodes.length === 0) return;
+        function updateSVGSize(visibleNodes) {
+            if (visibleNodes.length === 0) return;
             let maxX = 0;
             let maxY = 0;
-            nodes.forEach(node => {
-                const rect = node.querySelector('rect');
-                const x = parseFloat(rect.getAttribute('x')) + nodeWidth;
-                const y = parseFloat(rect.getAttribute('y')) + nodeHeight;
-                maxX = Math.max(maxX, x);
-                maxY = Math.max(maxY, y);
-            });
+            for (const node of visibleNodes) {
+                maxX = Math.max(maxX, node.x + nodeWidth);
+                maxY = Math.max(maxY, node.y + nodeHeight);
+            }
             maxX += 100;
             maxY += 150;
             svg.setAttribute('viewBox', `0 0 ${maxX} ${maxY}`);
@@ -286,37 +471,101 @@ class DirectorySVGGenerator:
             svg.setAttribute('height', maxY);
         }
         function renderTree() {
-            nodesGroup.innerHTML = '';
-            connectionsGroup.innerHTML = '';
-            calculateNodePositions();
-            renderConnections();
-            renderNodes();
-            updateSVGSize();
+            const { visibleNodes, visibleSet } = calculateNodePositions();
+            renderConnections(visibleNodes, visibleSet);
+            renderNodes(visibleNodes);
+            renderedNodes.clear();
+            renderedConnections.clear();
+            indexRenderedElements(0, 0);
+            updateSVGSize(visibleNodes);
+        }
+        // Applies a toggle by touching only the elements that changed: hidden
+        // nodes are removed, newly shown ones inserted and shifted ones moved.
+        function updateTree() {
+            const { visibleNodes, visibleSet } = calculateNodePositions();
+            for (const [id, elem] of renderedNodes) {
+                if (!visibleSet.has(id)) {
+                    elem.remove();
+                    renderedNodes.delete(id);
+                }
+            }
+            for (const [id, elem] of renderedConnections) {
+                if (!visibleSet.has(id)) {
+                    elem.remove();
+                    renderedConnections.delete(id);
+                }
+            }
+            const nodeParts = [];
+            const connectionParts = [];
+            for (const node of visibleNodes) {
+                const elem = renderedNodes.get(node.id);
+                if (!elem) {
+                    nodeParts.push(nodeMarkup(node));
+                } else if (node.renderedTransform !== nodeTransform(node)) {
+                    node.renderedTransform = nodeTransform(node);
+                    elem.setAttribute('transform', node.renderedTransform);
+                }
+                if (!node.parent) continue;
+                const path = renderedConnections.get(node.id);
+                if (!path) {
+                    connectionParts.push(connectionMarkup(treeData[node.parent], node));
+                } else {
+                    const d = connectionPath(treeData[node.parent], node);
+                    if (node.renderedPath !== d) {
+                        node.renderedPath = d;
+                        path.setAttribute('d', d);
+                    }
+                }
+            }
+            const nodeCount = nodesGroup.children.length;
+            const connectionCount = connectionsGroup.children.length;
+            if (nodeParts.length) nodesGroup.insertAdjacentHTML('beforeend', nodeParts.join(''));
+            if (connectionParts.length) connectionsGroup.insertAdjacentHTML('beforeend', connectionParts.join(''));
+            indexRenderedElements(nodeCount, connectionCount);
+            updateSVGSize(visibleNodes);
+        }
+        // Registers the rendered elements from the given child offsets onward
+        function indexRenderedElements(nodeStart, connectionStart) {
+            const nodeElems = nodesGroup.children;
+            for (let i = nodeStart; i < nodeElems.length; i++) {
+                const node = treeData[nodeElems[i].dataset.id];
+                node.renderedTransform = nodeTransform(node);
+                renderedNodes.set(node.id, nodeElems[i]);
+            }
+            const connectionElems = connectionsGroup.children;
+            for (let i = connectionStart; i < connectionElems.length; i++) {
+                const node = treeData[connectionElems[i].dataset.id];
+                node.renderedPath = connectionPath(treeData[node.parent], node);
+                renderedConnections.set(node.id, connectionElems[i]);
+            }
         }
-                   
         function calculateNodePositions() {
             const visibleNodes = [];
-            function traverseVisible(nodeId, level = 0, position = 0) {
-                const node = treeData[nodeId];
-                if (!nodeStates[nodeId].visible) return position;
-                node.level = level;
-                node.y = position * verticalGap + 45;
-                visibleNodes.push(node);
-                position++;
-                if (nodeStates[nodeId].expanded) {
-                    for (const childId of node.children) {
-                        if (nodeStates[childId].visible) {  // Yalnızca görünür çocukları işle
-                            position = traverseVisible(childId, level + 1, position);
+            let maxLevel = 0;
+            // Iterative pre-order walk; children are pushed in reverse so
+            // they pop in display order. Avoids recursion depth limits.
+            if (rootId && nodeStates[rootId].visible) {
+                const stack = [[rootId, 0]];
+                let position = 0;
+                while (stack.length) {
+                    const [nodeId, level] = stack.pop();
+                    const node = treeData[nodeId];
+                    node.level = level;
+                    if (level > maxLevel) maxLevel = level;
+                    node.y = position * verticalGap + 45;
+                    visibleNodes.push(node);
+                    position++;
+                    if (nodeStates[nodeId].expanded) {
+                        const children = node.children;
+                        for (let i = children.length - 1; i >= 0; --i) {
+                            if (nodeStates[children[i]].visible) {  // Yalnızca görünür çocukları işle
+                                stack.push([children[i], level + 1]);
+                            }
                         }
                     }
                 }
-                return position;
-            }
-            if (rootId) {
-                traverseVisible(rootId);
             }
             const levelPositions = {};
-            const maxLevel = Math.max(...visibleNodes.map(n => n.level), 0);
             levelPositions[0] = 45;
             for (let level = 1; level <= maxLevel; level++) {
                 levelPositions[level] = levelPositions[level-1] + nodeWidth + horizontalGap;
@@ -324,97 +573,67 @@ class DirectorySVGGenerator:
             visibleNodes.forEach(node => {
                 node.x = levelPositions[node.level];
             });
+            const visibleSet = new Set(visibleNodes.map(n => n.id));
+            return { visibleNodes, visibleSet };
         }
-        function renderConnections() {
-            for (const nodeId in treeData) {
-                const node = treeData[nodeId];
-                if (!nodeStates[nodeId].visible) continue;
-                if (!nodeStates[nodeId].expanded || !node.children.length) continue;
+        function connectionPath(parent, child) {
+            const startX = parent.x + nodeWidth;
+            const startY = parent.y + (nodeHeight / 2);
+            const endX = child.x;
+            const endY = child.y + (nodeHeight / 2);
+            const controlX1 = startX + (endX - startX) * 0.4;
+            const controlX2 = startX + (endX - startX) * 0.6;
+            return `M ${startX} ${startY} C ${controlX1} ${startY}, ${controlX2} ${endY}, ${endX} ${endY}`;
+        }
+        function connectionMarkup(parent, child) {
+            return `<path data-id="${child.id}" d="${connectionPath(parent, child)}" stroke="#AAAAAA" stroke-width="2" fill="none" class="connector"/>`;
+        }
+        function renderConnections(visibleNodes, visibleSet) {
+            const parts = [];
+            for (const node of visibleNodes) {
+                if (!nodeStates[node.id].expanded || !node.children.length) continue;
                 for (const childId of node.children) {
-                    if (!nodeStates[childId].visible) continue;
-                    const child = treeData[childId];
-                    const startX = node.x + nodeWidth;
-                    const startY = node.y + (nodeHeight / 2);
-                    const endX = child.x;
-                    const endY = child.y + (nodeHeight / 2);
-                    const controlX1 = startX + (endX - startX) * 0.4;
-                    const controlX2 = startX + (endX - startX) * 0.6;
-                    const path = document.createElementNS('http://www.w3.org/2000/svg', 'path');
-                    path.setAttribute('d', `M ${startX} ${startY} C ${controlX1} ${startY}, ${controlX2} ${endY}, ${endX} ${endY}`);
-                    path.setAttribute('stroke', '#AAAAAA');
-                    path.setAttribute('stroke-width', '2');
-                    path.setAttribute('fill', 'none');
-                    path.setAttribute('class', 'connector');
-                    connectionsGroup.appendChild(path);
+                    if (!visibleSet.has(childId)) continue;
+                    parts.push(connectionMarkup(node, treeData[childId]));
                 }
             }
+            connectionsGroup.innerHTML = parts.join('');
         }
-        function renderNodes() {
-            for (const nodeId in treeData) {
-                const node = treeData[nodeId];
-                if (!nodeStates[nodeId].visible) continue;
-                const nodeGroup = document.createElementNS('http://www.w3.org/2000/svg', 'g');
-                nodeGroup.setAttribute('class', 'node');
-                nodeGroup.setAttribute('data-id', nodeId);
-                nodeGroup.addEventListener('click', (e) => toggleNode(nodeId, e));
-                const rect = document.createElementNS('http://www.w3.org/2000/svg', 'rect');
-                rect.setAttribute('x', node.x);
-                rect.setAttribute('y', node.y);
-                rect.setAttribute('width', nodeWidth);
-                rect.setAttribute('height', nodeHeight);
-                rect.setAttribute('rx', nodeRadius);
-                rect.setAttribute('ry', nodeRadius);
-                rect.setAttribute('fill', node.highlight ? '#FF4500' : node.color);  // Arama vurgusu
-                nodeGroup.appendChild(rect);
-                const circle = document.createElementNS('http://www.w3.org/2000/svg', 'circle');
-                circle.setAttribute('cx', node.x + 15);
-                circle.setAttribute('cy', node.y + nodeHeight / 2);
-                circle.setAttribute('r', '5');
-                circle.setAttribute('fill', '#FFD700');
-                nodeGroup.appendChild(circle);
-                const textName = document.createElementNS('http://www.w3.org/2000/svg', 'text');
-                textName.setAttribute('x', node.x + 30);
-                textName.setAttribute('y', node.y + nodeHeight / 2 - 5);
-                textName.setAttribute('font-family', 'Arial');
-                textName.setAttribute('font-size', '14px');
-                textName.setAttribute('fill', '#FFFFFF');
-                textName.setAttribute('class', 'node-text');
-                textName.textContent = node.name;
-                nodeGroup.appendChild(textName);
-                const textSize = document.createElementNS('http://www.w3.org/2000/svg', 'text');
-                textSize.setAttribute('x', node.x + 30);
-                textSize.setAttribute('y', node.y + nodeHeight / 2 + 15);
-                textSize.setAttribute('font-family', 'Arial');
-                textSize.setAttribute('font-size', '12px');
-                textSize.setAttribute('fill', '#FFFFFF');
-                textSize.setAttribute('class', 'node-text');
-                textSize.textContent = node.formatted_size;
-                nodeGroup.appendChild(textSize);
-                if (node.children.length > 0) {
-                    const toggleIcon = document.createElementNS('http://www.w3.org/2000/svg', 'text');
-                    toggleIcon.setAttribute('x', node.x + nodeWidth - 20);
-                    toggleIcon.setAttribute('y', node.y + nodeHeight / 2 + 5);
-                    toggleIcon.setAttribute('font-family', 'Arial');
-                    toggleIcon.setAttribute('font-size', '18px');
-                    toggleIcon.setAttribute('fill', '#FFFFFF');
-                    toggleIcon.setAttribute('class', 'toggle-icon');
-                    toggleIcon.textContent = nodeStates[nodeId].expanded ? '−' : '+';
-                    toggleIcon.addEventListener('click', (e) => {
-                        toggleNode(nodeId, e);
-                        e.stopPropagation();
-                    });
-                    nodeGroup.appendChild(toggleIcon);
-                }
-                nodesGroup.appendChild(nodeGroup);
+        function escapeHtml(text) {
+            return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+        }
+        function nodeTransform(node) {
+            return `translate(${node.x},${node.y})`;
+        }
+        // Node contents are positioned relative to the group so moving a node
+        // is a single transform update
+        function nodeMarkup(node) {
+            const parts = [
+                `<g class="node" data-id="${node.id}" transform="${nodeTransform(node)}">`,
+                `<rect width="${nodeWidth}" height="${nodeHeight}" rx="${nodeRadius}" ry="${nodeRadius}" fill="${node.highlight ? '#FF4500' : node.color}"/>`,  // Arama vurgusu
+                `<circle cx="15" cy="${nodeHeight / 2}" r="5" fill="#FFD700"/>`,
+                `<text x="30" y="${nodeHeight / 2 - 5}" font-family="Arial" font-size="14px" fill="#FFFFFF" class="node-text">${escapeHtml(node.name)}</text>`,
+                `<text x="30" y="${nodeHeight / 2 + 15}" font-family="Arial" font-size="12px" fill="#FFFFFF" class="node-text">${node.formattedSize}</text>`
+            ];
+            if (node.children.length > 0) {
+                parts.push(`<text x="${nodeWidth - 20}" y="${nodeHeight / 2 + 5}" font-family="Arial" font-size="18px" fill="#FFFFFF" class="toggle-icon">${nodeStates[node.id].expanded ? '−' : '+'}</text>`);
             }
+            parts.push('</g>');
+            return parts.join('');
+        }
+        function renderNodes(visibleNodes) {
+            nodesGroup.innerHTML = visibleNodes.map(nodeMarkup).join('');
         }
         function collapseSubtree(nodeId) {
-            const node = treeData[nodeId];
-            nodeStates[nodeId].expanded = false;
-            node.children.forEach(childId => {
-                nodeStates[childId].visible = false;
-                collapseSubtree(childId);
-            });
+            const stack = [nodeId];
+            while (stack.length) {
+                const id = stack.pop();
+                nodeStates[id].expanded = false;
+                for (const childId of treeData[id].children) {
+                    nodeStates[childId].visible = false;
+                    stack.push(childId);
+                }
+            }
         }
         function toggleNode(nodeId, event) {
             nodeStates[nodeId].expanded = !nodeStates[nodeId].expanded;
@@ -425,7 +644,9 @@ class DirectorySVGGenerator:
                     nodeStates[childId].visible = true;
                 });
             }
-            renderTree();
+            const toggleIcon = renderedNodes.get(nodeId).querySelector('.toggle-icon');
+            if (toggleIcon) toggleIcon.textContent = nodeStates[nodeId].expanded ? '−' : '+';
+            updateTree();
         }
                    
         function searchNodes(searchTerm) {
@@ -451,7 +672,7 @@ class DirectorySVGGenerator:
             // Eşleşen düğümleri bul ve genişlet
             Object.keys(treeData).forEach(id => {
                 const node = treeData[id];
-                if (node.name.toLowerCase().includes(searchTerm)) {
+                if (node.lowerName.includes(searchTerm)) {
                     node.highlight = true;  // Eşleşen düğümü vurgula
                     nodeStates[id].expanded = true;  // Eşleşen düğümü genişlet
                     nodeStates[id].visible = true;   // Görünür yap
@@ -468,27 +689,28 @@ class DirectorySVGGenerator:
             });
         }
         </script>
-        ''')
-        svg.append('</body>')
-        svg.append('</html>')
-        return '\n'.join(svg)
+</body>
+</html>'''
+        f.write(template_head)
+        json.dump(self.directory_tree, f, separators=(',', ':'))
+        f.write(template_tail)
 
     def _generate_id(self, path):
-        return "node_" + hashlib.md5(path.encode()).hexdigest()[:8]
+        return "node_" + hashlib.blake2b(path.encode('utf-8', 'surrogateescape'), digest_size=4).hexdigest()
 
     def save_svg(self, output_path):
-        self.scan_directory_sizes()
-        self.build_directory_tree()
-        html_content = self.generate_interactive_svg()
+        self._scan_and_build(self.root_dir)
         if not os.path.isabs(output_path):
             output_path = os.path.join(self.root_dir, output_path)
         if output_path.endswith('.svg'):
             output_path = output_path[:-4] + '.html'
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            self.generate_interactive_svg(f)
         return output_path
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description='Generate an interactive SVG visualization of directory structure with collapsible nodes')
     parser.add_argument('directory', nargs='?', default=os.path.dirname(os.path.abspath(__file__)), 
                         help='Directory to visualize (defaults to script directory)')
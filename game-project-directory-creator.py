@@ -3,16 +3,411 @@
 
 import os
 import sys
-import shutil
+import string
 import datetime
-import argparse
+from types import SimpleNamespace
+from functools import lru_cache
 
 # Define production phases
 PRE_PRODUCTION = "Pre-Production"
 PRODUCTION = "Production"
 POST_PRODUCTION = "Post-Production"
 
-def create_game_directory_structure(game_name, root_directory, engine="Custom", platforms=None):
+# Engines and platforms offered on the command line, in the order shown in help text
+ENGINE_CHOICES = ("Custom", "Unity", "Unreal", "Godot")
+PLATFORM_CHOICES = ("Windows", "MacOS", "Linux", "Android", "iOS", "PlayStation", "Xbox", "Nintendo", "Web")
+
+# Comma-separated forms of the above for help text and prompts
+_ENGINES_HELP = ", ".join(ENGINE_CHOICES)
+_PLATFORMS_HELP = ", ".join(PLATFORM_CHOICES)
+
+# Sets of the above for membership checks
+_AVAILABLE_ENGINES = frozenset(ENGINE_CHOICES)
+_AVAILABLE_PLATFORMS = frozenset(PLATFORM_CHOICES)
+
+# Directory containing this script (default root directory for new projects)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Directory holding the template files copied into new projects
+TEMPLATES_DIR = os.path.join(_SCRIPT_DIR, "templates")
+
+# Contents of the generated project README ($-placeholders are filled in per project)
+README_TEMPLATE = string.Template(f"""# $game_name
+
+Game development project created on $created
+
+## Game Engine
+
+$engine
+
+## Target Platforms
+
+$platforms
+
+## Directory Structure
+
+### Production Pipeline
+
+- **{PRE_PRODUCTION}**: Pre-production materials (concept, story, design, planning)
+- **{PRODUCTION}**: Production phase materials (asset creation, animation, implementation)
+- **{POST_PRODUCTION}**: Post-production materials (compositing, effects, final polishing)
+
+### Development Structure
+
+- **Documentation**: Design documents, technical specifications, and API references
+- **Source**: Source code for the game and engine
+- **Assets**: Game assets including models, textures, animations, audio, etc.
+- **Build**: Build files for different platforms
+- **Tests**: Test code including unit tests and integration tests
+- **ThirdParty**: Third-party libraries and tools
+- **Scripts**: Automation and utility scripts
+- **Config**: Configuration files
+- **Versions**: Version management
+- **Releases**: Release builds for different distribution channels
+- **tmp**: Temporary files, builds, caches, and logs
+""")
+
+# Directories created for every project, with the contents of their description.txt files
+_BASE_DIRS = (
+    # Production Pipeline Organization
+    (f"{PRE_PRODUCTION}/Idea", "Contains initial game concept documents and brainstorming materials."),
+    (f"{PRE_PRODUCTION}/Story", "Contains narrative structure, plot outlines, and story development documents."),
+    (f"{PRE_PRODUCTION}/Characters", "Contains character designs, backstories, and development."),
+    (f"{PRE_PRODUCTION}/ArtDirection", "Contains art style guides, mood boards, and visual direction documents."),
+    (f"{PRE_PRODUCTION}/Storyboard", "Contains storyboards for cutscenes and key game moments."),
+    (f"{PRE_PRODUCTION}/ProductPlanning", "Contains project schedules, milestone planning, and production roadmaps."),
+    (f"{PRE_PRODUCTION}/Marketing", "Contains early marketing plans, target audience analysis, and promotional strategy."),
+    (f"{PRE_PRODUCTION}/VocalTracks", "Contains voice acting scripts, audition materials, and placeholder recordings."),
+    (f"{PRE_PRODUCTION}/StoryReel", "Contains animatics and early visualization of game sequences."),
+    (f"{PRE_PRODUCTION}/RnD", "Contains research and development materials for new gameplay features or technologies."),
+    
+    (f"{PRODUCTION}/Layout", "Contains scene layout files and environment blocking."),
+    (f"{PRODUCTION}/Modeling", "Contains 3D modeling files and assets in production."),
+    (f"{PRODUCTION}/Texturing", "Contains texturing work files and materials in development."),
+    (f"{PRODUCTION}/Rigging", "Contains character and object rig files and setups."),
+    (f"{PRODUCTION}/Animation", "Contains animation work in progress and animation systems."),
+    (f"{PRODUCTION}/Lighting", "Contains lighting setups and environment illumination assets."),
+    (f"{PRODUCTION}/VFX", "Contains visual effects work and particle systems in development."),
+    (f"{PRODUCTION}/SoundFX", "Contains sound effects work files and mixing in progress."),
+    (f"{PRODUCTION}/Music", "Contains musical score work and soundtrack development."),
+    (f"{PRODUCTION}/Rendering", "Contains rendering outputs and material previews."),
+    (f"{PRODUCTION}/TitleCredits", "Contains title screen and credits sequence development."),
+    (f"{PRODUCTION}/CharSetup", "Contains character finalization and implementation."),
+    
+    (f"{POST_PRODUCTION}/Compositing", "Contains scene composition work and final visual integration."),
+    (f"{POST_PRODUCTION}/2DVFX", "Contains 2D visual effects and motion graphics elements."),
+    (f"{POST_PRODUCTION}/ColorCorrection", "Contains color grading and final visual polish."),
+    (f"{POST_PRODUCTION}/FinalOutput", "Contains finalized game scenes ready for implementation."),
+    
+    ("Documentation/Design", "Contains game design documents, concept art, and gameplay specifications."),
+    ("Documentation/Technical", "Contains technical documentation, architecture diagrams, and implementation details."),
+    ("Documentation/API", "Contains API reference documentation for the game's programming interfaces."),
+    
+    ("Source/Core", "Contains core game engine systems and fundamental components."),
+    ("Source/Game", "Contains game-specific code, gameplay mechanics, and game logic."),
+    ("Source/Engine", "Contains engine components, rendering systems, physics, and other subsystems."),
+    ("Source/Tools", "Contains development tools and utilities for the game development process."),
+    ("Source/Tools/BlenderAddons", "Contains custom Blender add-ons for the game development pipeline."),
+    
+    ("Assets/Models/Sources", "Contains original Blender (.blend) model files."),
+    ("Assets/Models/Exported", "Contains exported game-ready models in engine-compatible formats."),
+    ("Assets/Textures", "Contains texture files, materials, and surface descriptions."),
+    ("Assets/Animations", "Contains character and object animations."),
+    ("Assets/Audio", "Contains sound effects, music, and voice recordings."),
+    ("Assets/Shaders", "Contains shader programs for visual effects and rendering techniques."),
+    ("Assets/UI", "Contains user interface assets, icons, and UI-specific graphics."),
+    ("Assets/3DAnimate", "Contains 3D animation files and rigs for game characters and objects."),
+    
+    ("tmp/Builds", "Contains temporary build files and intermediate compilation results."),
+    ("tmp/Cache", "Contains cached data for faster loading and processing."),
+    ("tmp/Logs", "Contains log files generated during development and testing."),
+    ("tmp/Backups", "Contains automatic backups of project files."),
+    ("tmp/Renders", "Contains temporary rendering outputs and previews."),
+    ("tmp/Debug", "Contains debug information and crash dumps."),
+    ("tmp/Testing", "Contains temporary files generated during testing."),
+    ("tmp/Artifacts", "Contains build artifacts and intermediate files."),
+    ("tmp/AutoSave", "Contains auto-saved versions of project files."),
+    ("tmp/Exports", "Contains temporary exported files before final placement."),
+    ("tmp/Media/Images", "Contains temporary images, screenshots, and visual assets used during development."),
+    ("tmp/Media/Audio", "Contains temporary audio files, voice recordings, and sound effects for testing."),
+    ("tmp/Media/Video", "Contains temporary video files, cutscenes, and animations for review."),
+    ("tmp/Media/Textures", "Contains in-progress and temporary textures before final implementation."),
+    ("tmp/Prototypes", "Contains prototype assets and code for experimental features."),
+    ("tmp/Staging", "Contains assets staged for review before moving to production assets."),
+    ("tmp/Review", "Contains assets under review by team members or clients."),
+    ("tmp/Processing", "Contains assets currently being processed or converted."),
+    ("tmp/Import", "Contains recently imported assets pending proper organization."),
+    ("tmp/Outsourced", "Contains temporary storage for assets from external partners or contractors."),
+    
+    ("Tests/Unit", "Contains unit tests for individual components and systems."),
+    ("Tests/Integration", "Contains integration tests for testing how components work together."),
+    
+    ("ThirdParty/Libraries", "Contains third-party libraries and dependencies used by the game."),
+    ("ThirdParty/Tools", "Contains third-party tools used in the game development process."),
+    
+    ("Scripts/Build", "Contains scripts for automating the build process."),
+    ("Scripts/Deploy", "Contains scripts for deploying the game to various platforms."),
+    ("Scripts/Tools", "Contains utility scripts for development workflow automation."),
+    ("Scripts/Pipeline", "Contains scripts for asset pipeline automation, particularly for Blender to game engine exports."),
+    ("Scripts/CI", "Contains continuous integration scripts for automated testing, building, and deployment in CI/CD workflows."),
+    
+    ("Config/Engine", "Contains configuration files for the game engine."),
+    ("Config/Game", "Contains game-specific configuration files."),
+    
+    ("Versions/Current", "Contains or links to the current active development version."),
+    ("Releases/Internal", "Contains builds for internal testing and development."),
+    ("Releases/External", "Contains builds for external testing and beta releases."),
+    ("Releases/Public", "Contains public release builds and distribution packages."),
+)
+
+# Engine-specific entries as (path, description, is_file); [GameName] is replaced per project
+_ENGINE_STRUCTURES = {
+    "Unity": (
+        ("Assets/Prefabs", "Contains reusable Unity prefab objects.", False),
+        ("Assets/Materials", "Contains Unity material definitions.", False),
+        ("Assets/Scenes", "Contains Unity scene files.", False),
+        ("Assets/Scripts", "Contains C# scripts for Unity.", False),
+        ("Assets/Editor", "Contains Unity editor extensions and scripts.", False),
+        ("Assets/Resources", "Contains assets that need to be accessed via Resources.Load.", False),
+        ("ProjectSettings", "Contains Unity project settings.", False),
+        ("Packages", "Contains Unity package manager configuration.", False),
+    ),
+    "Unreal": (
+        ("Content/Blueprints", "Contains Unreal Blueprint assets.", False),
+        ("Content/Materials", "Contains Unreal material definitions.", False),
+        ("Content/Levels", "Contains Unreal level files.", False),
+        ("Content/Characters", "Contains character assets and blueprints.", False),
+        ("Content/UI", "Contains UI assets and widgets.", False),
+        ("Source/[GameName]", "Contains C++ code for the game.", False),
+        ("Config/DefaultEngine.ini", "Contains engine configuration.", True),
+        ("Config/DefaultGame.ini", "Contains game configuration.", True),
+    ),
+    "Godot": (
+        ("scenes", "Contains Godot scene files.", False),
+        ("scripts", "Contains GDScript files.", False),
+        ("assets", "Contains game assets for Godot.", False),
+        ("addons", "Contains Godot addons and plugins.", False),
+        ("project.godot", "Godot project configuration file.", True),
+        ("export_presets.cfg", "Godot export configurations.", True),
+    ),
+    "Custom": (
+        # No additional directories for Custom engine
+    ),
+}
+
+# Usage examples printed by --examples
+_EXAMPLES_TEXT = "\n".join([
+    "\nUsage Examples:",
+    "=" * 80,
+    "1. Basic usage (interactive):",
+    "   python game-project-directory-creator.py",
+    "",
+    "2. Basic usage with command-line arguments:",
+    "   python game-project-directory-creator.py --game-name \"My Awesome Game\" --root-dir \"C:\\Projects\"",
+    "",
+    "3. Specify game engine:",
+    "   python game-project-directory-creator.py --game-name \"My Unity Game\" --engine Unity",
+    "",
+    "4. Specify target platforms:",
+    "   python game-project-directory-creator.py --game-name \"Mobile Game\" --platforms Windows,Android,iOS",
+    "",
+    "5. Full example with all parameters:",
+    "   python game-project-directory-creator.py --game-name \"Space Adventure\" --root-dir \"D:\\Games\" --engine Unreal --platforms Windows,PlayStation,Xbox",
+    "",
+    "6. Create a project and then use the cleanup script:",
+    "   python game-project-directory-creator.py --game-name \"My Game\"",
+    "   python Scripts/Tools/cleanup_tmp.py --age 30",
+    "=" * 80,
+    "\nDirectory Structure Overview:",
+    "=" * 80,
+    "The generated directory structure includes:",
+    "",
+    "1. Production Pipeline Directories:",
+    "   - Pre-Production: Idea, Story, Characters, Storyboard, etc.",
+    "   - Production: Modeling, Animation, Texturing, Lighting, etc.",
+    "   - Post-Production: Compositing, Color Correction, Final Output, etc.",
+    "",
+    "2. Development Structure:",
+    "   - Source code, assets, documentation, and other standard directories",
+    "   - Engine-specific directories based on the chosen game engine",
+    "   - Platform-specific build directories",
+    "",
+    "3. Temporary Files:",
+    "   - Comprehensive tmp directory structure for all temporary assets",
+    "   - Includes specialized directories for media, renders, and workflow",
+    "   - Comes with cleanup script for managing temporary files",
+    "=" * 80,
+]) + "\n"
+
+# Number of threads used to issue filesystem calls concurrently
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _mkdir_many(paths, mkdir=os.mkdir):
+    """
+    Creates each of the given directories, ignoring the ones that already exist
+    
+    Runs as one tight loop per task so the executor bookkeeping is paid per
+    batch rather than per directory.
+    
+    Args:
+        paths (list): Directories to create, each listed after its parent
+        mkdir (callable): Bound os.mkdir, to keep the lookup out of the loop
+    """
+    for path in paths:
+        try:
+            mkdir(path)
+        except FileExistsError:
+            pass
+
+def _mkdir_cached(path, seen):
+    """
+    Creates a directory and any missing parents, skipping directories already in seen
+    
+    The directory itself is tried first; parents are only walked when it turns
+    out to be missing one, so an existing parent costs no extra system calls.
+    
+    Args:
+        path (str): Directory to create
+        seen (set): Directories already created or known to exist; updated in place
+    """
+    if path in seen:
+        return
+    try:
+        os.mkdir(path)
+    except FileNotFoundError:
+        parent = os.path.dirname(path)
+        if parent == path:
+            raise
+        _mkdir_cached(parent, seen)
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+    except FileExistsError:
+        pass
+    seen.add(path)
+
+def _make_directories(root, directories, executor, seen):
+    """
+    Creates the given directories, and any missing parents, below an existing root
+    
+    Every path prefix is created with a single os.mkdir, parents before children,
+    so no per-call existence checks are needed. Each top-level subtree is
+    independent of the others and is created by its own task, and directories
+    already in seen are skipped.
+    
+    Args:
+        root (str): Existing directory the paths are relative to
+        directories (list): Relative directory paths, using "/" as separator
+        executor (ThreadPoolExecutor): Executor used to run the os.mkdir calls
+        seen (set): Directories already created or known to exist; updated in place
+    """
+    from concurrent.futures import as_completed
+    
+    root_prefix = root + os.sep
+    subtrees = {}
+    for directory in directories:
+        # Extend one prefix string per level instead of re-joining the leading parts
+        parts = directory.split("/")
+        path = root_prefix + parts[0]
+        for depth, part in enumerate(parts):
+            if depth:
+                path = path + "/" + part
+            if part and path not in seen:
+                seen.add(path)
+                subtrees.setdefault(parts[0], []).append(path)
+    
+    futures = [executor.submit(_mkdir_many, paths) for paths in subtrees.values()]
+    for future in as_completed(futures):
+        future.result()
+
+def _write_file(path, text, exclusive=False):
+    """
+    Writes a text file with a single write call
+    
+    Args:
+        path (str): Path of the file to create or overwrite
+        text (str): Full contents of the file
+        exclusive (bool): If True, raise FileExistsError instead of overwriting an existing file
+    """
+    data = memoryview(text.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    fd = os.open(path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _write_new_file(path, text):
+    """
+    Writes a text file unless it already exists or its directory is missing
+    
+    Both cases are reported by the open call itself, so no existence checks are needed.
+    
+    Args:
+        path (str): Path of the file to create
+        text (str): Full contents of the file
+    """
+    try:
+        _write_file(path, text, exclusive=True)
+    except (FileExistsError, FileNotFoundError):
+        pass
+
+@lru_cache(maxsize=32)
+def _plan_structure(engine, platforms):
+    """
+    Lists every directory for an engine and set of platforms, independent of the game name
+    
+    Args:
+        engine (str): Game engine to be used
+        platforms (tuple): Target platforms
+    
+    Returns:
+        tuple: Unique relative directory paths, sorted so that every parent precedes
+            its children; engine paths may still contain the [GameName] placeholder
+    """
+    directories = [directory for directory, _ in _BASE_DIRS]
+    directories.extend(f"Build/{platform}" for platform in platforms)
+    directories.extend(directory.rpartition("/")[0] if is_file else directory
+                       for directory, _, is_file in _ENGINE_STRUCTURES.get(engine, ()))
+    
+    planned = set()
+    for directory in directories:
+        parts = directory.split("/")
+        prefix = parts[0]
+        for depth, part in enumerate(parts):
+            if depth:
+                prefix = prefix + "/" + part
+            if part:
+                planned.add(prefix)
+    
+    return tuple(sorted(planned))
+
+def plan_directories(game_name, engine="Custom", platforms=None):
+    """
+    Lists every directory of a game project without touching the disk
+    
+    The plan for an engine and set of platforms is computed once and reused;
+    only the game name is filled in per call.
+    
+    Args:
+        game_name (str): Name of the game
+        engine (str): Game engine to be used (default: "Custom")
+        platforms (list): Target platforms (default: ["Windows", "MacOS", "Linux"])
+    
+    Returns:
+        list: Unique directory paths relative to the game directory, using "/" as
+            separator, ordered so that every parent precedes its children
+    """
+    if platforms is None:
+        platforms = ["Windows", "MacOS", "Linux"]
+    
+    folder_name = game_name.replace(" ", "")
+    return [directory.replace("[GameName]", folder_name) if "[GameName]" in directory else directory
+            for directory in _plan_structure(engine, tuple(sorted(platforms)))]
+
+def create_game_directory_structure(game_name, root_directory, engine="Custom", platforms=None, verbose=False):
     """
     Creates a template directory structure for game development
     
@@ -21,152 +416,51 @@ def create_game_directory_structure(game_name, root_directory, engine="Custom",
         root_directory (str): Root directory where the game structure will be created
         engine (str): Game engine to be used (default: "Custom")
         platforms (list): Target platforms (default: ["Windows", "MacOS", "Linux"])
+        verbose (bool): Print every created directory instead of a single summary line
     
     Returns:
         str: Path to the created game directory
     """
+    # Only needed once a project is actually created, so --help/--examples stay fast
+    import json
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+    
     if platforms is None:
         platforms = ["Windows", "MacOS", "Linux"]
     
     # Create the full path for the game directory
     game_dir = os.path.join(root_directory, game_name.replace(" ", ""))
     
-    # Define directory structure with descriptions
-    directory_descriptions = {
-        # Production Pipeline Organization
-        f"{PRE_PRODUCTION}/Idea": "Contains initial game concept documents and brainstorming materials.",
-        f"{PRE_PRODUCTION}/Story": "Contains narrative structure, plot outlines, and story development documents.",
-        f"{PRE_PRODUCTION}/Characters": "Contains character designs, backstories, and development.",
-        f"{PRE_PRODUCTION}/ArtDirection": "Contains art style guides, mood boards, and visual direction documents.",
-        f"{PRE_PRODUCTION}/Storyboard": "Contains storyboards for cutscenes and key game moments.",
-        f"{PRE_PRODUCTION}/ProductPlanning": "Contains project schedules, milestone planning, and production roadmaps.",
-        f"{PRE_PRODUCTION}/Marketing": "Contains early marketing plans, target audience analysis, and promotional strategy.",
-        f"{PRE_PRODUCTION}/VocalTracks": "Contains voice acting scripts, audition materials, and placeholder recordings.",
-        f"{PRE_PRODUCTION}/StoryReel": "Contains animatics and early visualization of game sequences.",
-        f"{PRE_PRODUCTION}/RnD": "Contains research and development materials for new gameplay features or technologies.",
-        
-        f"{PRODUCTION}/Layout": "Contains scene layout files and environment blocking.",
-        f"{PRODUCTION}/Modeling": "Contains 3D modeling files and assets in production.",
-        f"{PRODUCTION}/Texturing": "Contains texturing work files and materials in development.",
-        f"{PRODUCTION}/Rigging": "Contains character and object rig files and setups.",
-        f"{PRODUCTION}/Animation": "Contains animation work in progress and animation systems.",
-        f"{PRODUCTION}/Lighting": "Contains lighting setups and environment illumination assets.",
-        f"{PRODUCTION}/VFX": "Contains visual effects work and particle systems in development.",
-        f"{PRODUCTION}/SoundFX": "Contains sound effects work files and mixing in progress.",
-        f"{PRODUCTION}/Music": "Contains musical score work and soundtrack development.",
-        f"{PRODUCTION}/Rendering": "Contains rendering outputs and material previews.",
-        f"{PRODUCTION}/TitleCredits": "Contains title screen and credits sequence development.",
-        f"{PRODUCTION}/CharSetup": "Contains character finalization and implementation.",
-        
-        f"{POST_PRODUCTION}/Compositing": "Contains scene composition work and final visual integration.",
-        f"{POST_PRODUCTION}/2DVFX": "Contains 2D visual effects and motion graphics elements.",
-        f"{POST_PRODUCTION}/ColorCorrection": "Contains color grading and final visual polish.",
-        f"{POST_PRODUCTION}/FinalOutput": "Contains finalized game scenes ready for implementation.",
-        
-        "Documentation/Design": "Contains game design documents, concept art, and gameplay specifications.",
-        "Documentation/Technical": "Contains technical documentation, architecture diagrams, and implementation details.",
-        "Documentation/API": "Contains API reference documentation for the game's programming interfaces.",
-        
-        "Source/Core": "Contains core game engine systems and fundamental components.",
-        "Source/Game": "Contains game-specific code, gameplay mechanics, and game logic.",
-        "Source/Engine": "Contains engine components, rendering systems, physics, and other subsystems.",
-        "Source/Tools": "Contains development tools and utilities for the game development process.",
-        "Source/Tools/BlenderAddons": "Contains custom Blender add-ons for the game development pipeline.",
-        
-        "Assets/Models/Sources": "Contains original Blender (.blend) model files.",
-        "Assets/Models/Exported": "Contains exported game-ready models in engine-compatible formats.",
-        "Assets/Textures": "Contains texture files, materials, and surface descriptions.",
-        "Assets/Animations": "Contains character and object animations.",
-        "Assets/Audio": "Contains sound effects, music, and voice recordings.",
-        "Assets/Shaders": "Contains shader programs for visual effects and rendering techniques.",
-        "Assets/UI": "Contains user interface assets, icons, and UI-specific graphics.",
-        "Assets/3DAnimate": "Contains 3D animation files and rigs for game characters and objects.",
-        
-        "tmp/Builds": "Contains temporary build files and intermediate compilation results.",
-        "tmp/Cache": "Contains cached data for faster loading and processing.",
-        "tmp/Logs": "Contains log files generated during development and testing.",
-        "tmp/Backups": "Contains automatic backups of project files.",
-        "tmp/Renders": "Contains temporary rendering outputs and previews.",
-        "tmp/Debug": "Contains debug information and crash dumps.",
-        "tmp/Testing": "Contains temporary files generated during testing.",
-        "tmp/Artifacts": "Contains build artifacts and intermediate files.",
-        "tmp/AutoSave": "Contains auto-saved versions of project files.",
-        "tmp/Exports": "Contains temporary exported files before final placement.",
-        "tmp/Media/Images": "Contains temporary images, screenshots, and visual assets used during development.",
-        "tmp/Media/Audio": "Contains temporary audio files, voice recordings, and sound effects for testing.",
-        "tmp/Media/Video": "Contains temporary video files, cutscenes, and animations for review.",
-        "tmp/Media/Textures": "Contains in-progress and temporary textures before final implementation.",
-        "tmp/Prototypes": "Contains prototype assets and code for experimental features.",
-        "tmp/Staging": "Contains assets staged for review before moving to production assets.",
-        "tmp/Review": "Contains assets under review by team members or clients.",
-        "tmp/Processing": "Contains assets currently being processed or converted.",
-        "tmp/Import": "Contains recently imported assets pending proper organization.",
-        "tmp/Outsourced": "Contains temporary storage for assets from external partners or contractors.",
-        
-        "Tests/Unit": "Contains unit tests for individual components and systems.",
-        "Tests/Integration": "Contains integration tests for testing how components work together.",
-        
-        "ThirdParty/Libraries": "Contains third-party libraries and dependencies used by the game.",
-        "ThirdParty/Tools": "Contains third-party tools used in the game development process.",
-        
-        "Scripts/Build": "Contains scripts for automating the build process.",
-        "Scripts/Deploy": "Contains scripts for deploying the game to various platforms.",
-        "Scripts/Tools": "Contains utility scripts for development workflow automation.",
-        "Scripts/Pipeline": "Contains scripts for asset pipeline automation, particularly for Blender to game engine exports.",
-        "Scripts/CI": "Contains continuous integration scripts for automated testing, building, and deployment in CI/CD workflows.",
-        
-        "Config/Engine": "Contains configuration files for the game engine.",
-        "Config/Game": "Contains game-specific configuration files.",
-        
-        "Versions/Current": "Contains or links to the current active development version.",
-        "Releases/Internal": "Contains builds for internal testing and development.",
-        "Releases/External": "Contains builds for external testing and beta releases.",
-        "Releases/Public": "Contains public release builds and distribution packages."
-    }
+    # Use a single timestamp for every generated file
+    created = datetime.datetime.now()
     
     # Create each directory in the structure and add description.txt
     print(f"Creating directory structure for {game_name} at {game_dir}...")
     
-    # Create root directory description
+    # Root directory description
     root_desc_path = os.path.join(game_dir, "description.txt")
-    os.makedirs(game_dir, exist_ok=True)
-    with open(root_desc_path, "w") as f:
-        f.write(f"# {game_name} Project Root\n\n")
-        f.write("This is the main project directory for the game. It contains all source code, assets, and documentation.\n")
-        f.write("The directory structure follows game development best practices and is organized by function.\n")
-        f.write("Each subdirectory contains a description.txt file explaining its purpose.\n")
-        f.write(f"Game Engine: {engine}\n")
-        f.write(f"Target Platforms: {', '.join(platforms)}\n")
+    seen = set()
+    _mkdir_cached(game_dir, seen)
+    root_description = (
+        f"# {game_name} Project Root\n\n"
+        "This is the main project directory for the game. It contains all source code, assets, and documentation.\n"
+        "The directory structure follows game development best practices and is organized by function.\n"
+        "Each subdirectory contains a description.txt file explaining its purpose.\n"
+        f"Game Engine: {engine}\n"
+        f"Target Platforms: {', '.join(platforms)}\n"
+    )
     
     # Create platform-specific build directories
     build_dirs = {}
     for platform in platforms:
         build_dirs[f"Build/{platform}"] = f"Contains build outputs and packages for {platform} platform."
     
-    # Update the directory_descriptions with platform-specific build directories
-    for key, value in build_dirs.items():
-        directory_descriptions[key] = value
-    
-    # Remove build directories that are not in platforms
-    for key in list(directory_descriptions.keys()):
-        if key.startswith("Build/") and not any(key == f"Build/{platform}" for platform in platforms):
-            if key not in build_dirs:
-                directory_descriptions.pop(key, None)
-    
-    # Create directories with descriptions
-    for directory, description in directory_descriptions.items():
-        dir_path = os.path.join(game_dir, directory)
-        os.makedirs(dir_path, exist_ok=True)
-        
-        # Create a description.txt file in each directory
-        desc_path = os.path.join(dir_path, "description.txt")
-        with open(desc_path, "w") as f:
-            f.write(f"# {directory}\n\n")
-            f.write(f"{description}\n")
-        
-        print(f"Created: {dir_path} (with description.txt)")
+    # Combine the shared directories with the platform-specific build directories
+    # (Build/ entries are only ever added for the requested platforms, never pruned)
+    directory_descriptions = _BASE_DIRS + tuple(build_dirs.items())
     
-    # Create description files for top-level directories that might not have been covered
+    # Descriptions for top-level directories that might not have been covered
     top_level_dirs = {
         "Documentation": "Contains all project documentation, including design documents, technical specifications, and API references.",
         "Source": "Contains all source code for the game, including core systems, gameplay code, and development tools.",
@@ -184,208 +478,57 @@ def create_game_directory_structure(game_name, root_directory, engine="Custom",
         POST_PRODUCTION: "Contains all post-production materials including compositing, effects, and final polishing."
     }
     
-    for directory, description in top_level_dirs.items():
-        dir_path = os.path.join(game_dir, directory)
-        if os.path.exists(dir_path):
-            desc_path = os.path.join(dir_path, "description.txt")
-            if not os.path.exists(desc_path):
-                with open(desc_path, "w") as f:
-                    f.write(f"# {directory}\n\n")
-                    f.write(f"{description}\n")
-    
-    # Create engine-specific folders based on the engine parameter
-    if engine != "Custom":
-        engine_folders = create_engine_specific_structure(engine, game_dir)
-        print(f"Created engine-specific folders for {engine}")
-    
-    # Create a README file
+    # Gather every generated file up front: description.txt files first
+    game_dir_prefix = game_dir + os.sep
+    desc_suffix = os.sep + "description.txt"
+    dir_paths = [game_dir_prefix + directory for directory, _ in directory_descriptions]
+    text_files = [(root_desc_path, root_description)]
+    text_files.extend((dir_path + desc_suffix, f"# {directory}\n\n{description}\n")
+                      for dir_path, (directory, description) in zip(dir_paths, directory_descriptions))
+    top_level_files = [(game_dir_prefix + directory + desc_suffix, f"# {directory}\n\n{description}\n")
+                       for directory, description in top_level_dirs.items()]
+    
+    # README file
     readme_path = os.path.join(game_dir, "README.md")
-    with open(readme_path, "w") as f:
-        f.write(f"# {game_name}\n\n")
-        f.write(f"Game development project created on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"## Game Engine\n\n{engine}\n\n")
-        f.write(f"## Target Platforms\n\n{', '.join(platforms)}\n\n")
-        f.write("## Directory Structure\n\n")
-        f.write("### Production Pipeline\n\n")
-        f.write(f"- **{PRE_PRODUCTION}**: Pre-production materials (concept, story, design, planning)\n")
-        f.write(f"- **{PRODUCTION}**: Production phase materials (asset creation, animation, implementation)\n")
-        f.write(f"- **{POST_PRODUCTION}**: Post-production materials (compositing, effects, final polishing)\n\n")
-        f.write("### Development Structure\n\n")
-        f.write("- **Documentation**: Design documents, technical specifications, and API references\n")
-        f.write("- **Source**: Source code for the game and engine\n")
-        f.write("- **Assets**: Game assets including models, textures, animations, audio, etc.\n")
-        f.write("- **Build**: Build files for different platforms\n")
-        f.write("- **Tests**: Test code including unit tests and integration tests\n")
-        f.write("- **ThirdParty**: Third-party libraries and tools\n")
-        f.write("- **Scripts**: Automation and utility scripts\n")
-        f.write("- **Config**: Configuration files\n")
-        f.write("- **Versions**: Version management\n")
-        f.write("- **Releases**: Release builds for different distribution channels\n")
-        f.write("- **tmp**: Temporary files, builds, caches, and logs\n")
-    
-    print(f"Created README file: {readme_path}")
+    text_files.append((readme_path, README_TEMPLATE.substitute(
+        game_name=game_name,
+        created=created.strftime('%Y-%m-%d %H:%M:%S'),
+        engine=engine,
+        platforms=', '.join(platforms),
+    )))
+    
+    # Version info file
+    version_path = os.path.join(game_dir, "version_info.json")
+    version_info = {
+        "name": game_name,
+        "version": "0.1.0",
+        "status": "development",
+        "created": created.isoformat(),
+        "engine": engine,
+        "platforms": platforms,
+    }
+    text_files.append((version_path, json.dumps(version_info, indent=2, ensure_ascii=False) + "\n"))
     
-    # Create a README file for the tmp directory
+    # Static files copied from the templates: tmp README, tmp cleanup script and .gitignore
     tmp_readme_path = os.path.join(game_dir, "tmp", "README.md")
-    with open(tmp_readme_path, "w") as f:
-        f.write("# Temporary Files Directory\n\n")
-        f.write("This directory contains all temporary files used during the development process. Files in this directory are not intended for version control and may be deleted by cleanup scripts.\n\n")
-        f.write("## Directory Structure\n\n")
-        f.write("- **Builds**: Temporary build files and intermediate compilation results\n")
-        f.write("- **Cache**: Cached data for faster loading and processing\n")
-        f.write("- **Logs**: Log files generated during development and testing\n")
-        f.write("- **Backups**: Automatic backups of project files\n")
-        f.write("- **Renders**: Temporary rendering outputs and previews\n")
-        f.write("- **Debug**: Debug information and crash dumps\n")
-        f.write("- **Testing**: Temporary files generated during testing\n")
-        f.write("- **Artifacts**: Build artifacts and intermediate files\n")
-        f.write("- **AutoSave**: Auto-saved versions of project files\n")
-        f.write("- **Exports**: Temporary exported files before final placement\n")
-        f.write("- **Media**: Temporary media assets\n")
-        f.write("  - **Images**: Temporary images, screenshots, and visual assets\n")
-        f.write("  - **Audio**: Temporary audio files, voice recordings, and sound effects\n")
-        f.write("  - **Video**: Temporary video files, cutscenes, and animations\n")
-        f.write("  - **Textures**: In-progress and temporary textures\n")
-        f.write("- **Prototypes**: Prototype assets and code for experimental features\n")
-        f.write("- **Staging**: Assets staged for review before production\n")
-        f.write("- **Review**: Assets under review by team members or clients\n")
-        f.write("- **Processing**: Assets currently being processed or converted\n")
-        f.write("- **Import**: Recently imported assets pending organization\n")
-        f.write("- **Outsourced**: Temporary storage for assets from external partners\n\n")
-        f.write("## Cleanup\n\n")
-        f.write("This directory can be cleaned periodically to free up disk space. Use the cleanup scripts in the Scripts/Tools directory for this purpose.\n")
-    
-    print(f"Created tmp directory README file: {tmp_readme_path}")
-    
-    # Create a cleanup script for tmp directory
     cleanup_script_dir = os.path.join(game_dir, "Scripts", "Tools")
     cleanup_script_path = os.path.join(cleanup_script_dir, "cleanup_tmp.py")
-    os.makedirs(cleanup_script_dir, exist_ok=True)
-    
-    cleanup_script_content = '''#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-
-import os
-import sys
-import shutil
-import datetime
-import argparse
-
-def cleanup_tmp_directory(project_root, dry_run=False, age_days=7, exclude_dirs=None):
-    """
-    Cleans up temporary files in the tmp directory that are older than specified age
-    
-    Args:
-        project_root (str): Root directory of the project
-        dry_run (bool): If True, only print what would be deleted without actually deleting
-        age_days (int): Delete files older than this many days
-        exclude_dirs (list): List of directories to exclude from cleanup
-    """
-    if exclude_dirs is None:
-        exclude_dirs = ['Backups']
-    
-    tmp_dir = os.path.join(project_root, 'tmp')
-    if not os.path.exists(tmp_dir):
-        print(f"Error: Temporary directory not found at {tmp_dir}")
-        return
-    
-    cutoff_date = datetime.datetime.now() - datetime.timedelta(days=age_days)
-    cutoff_timestamp = cutoff_date.timestamp()
-    
-    print(f"Cleaning up files older than {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'[DRY RUN] ' if dry_run else ''}Will delete files and empty directories in {tmp_dir}")
-    print(f"Excluding directories: {exclude_dirs}")
-    
-    total_size = 0
-    total_files = 0
-    total_dirs = 0
-    
-    # Walk through all files and directories in tmp
-    for root, dirs, files in os.walk(tmp_dir, topdown=False):
-        # Skip excluded directories
-        rel_path = os.path.relpath(root, tmp_dir)
-        if rel_path == '.':
-            rel_path = ''
-        
-        skip = False
-        for exclude in exclude_dirs:
-            if rel_path == exclude or rel_path.startswith(exclude + os.sep):
-                skip = True
-                break
-        
-        if skip:
-            continue
-        
-        # Delete old files
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                file_stat = os.stat(file_path)
-                file_mtime = file_stat.st_mtime
-                
-                if file_mtime < cutoff_timestamp:
-                    total_size += file_stat.st_size
-                    total_files += 1
-                    print(f"{'[DRY RUN] ' if dry_run else ''}Deleting file: {file_path}")
-                    if not dry_run:
-                        os.unlink(file_path)
-            except Exception as e:
-                print(f"Error processing {file_path}: {e}")
-        
-        # Delete empty directories
-        if not os.listdir(root) and root != tmp_dir:
-            total_dirs += 1
-            print(f"{'[DRY RUN] ' if dry_run else ''}Removing empty directory: {root}")
-            if not dry_run:
-                os.rmdir(root)
-    
-    # Convert total size to a human-readable format
-    size_str = ''
-    if total_size < 1024:
-        size_str = f"{total_size} bytes"
-    elif total_size < 1024 * 1024:
-        size_str = f"{total_size / 1024:.2f} KB"
-    elif total_size < 1024 * 1024 * 1024:
-        size_str = f"{total_size / (1024 * 1024):.2f} MB"
-    else:
-        size_str = f"{total_size / (1024 * 1024 * 1024):.2f} GB"
-    
-    print(f"\\nCleanup Summary:")
-    print(f"{'[DRY RUN] ' if dry_run else ''}Would free up {size_str} of disk space")
-    print(f"{'[DRY RUN] ' if dry_run else ''}Deleted {total_files} files and {total_dirs} directories")
-
-def main():
-    parser = argparse.ArgumentParser(description="Clean up temporary files in the project's tmp directory")
-    parser.add_argument('--project-root', help='Root directory of the project')
-    parser.add_argument('--dry-run', action='store_true', help='Only print what would be deleted without actually deleting')
-    parser.add_argument('--age', type=int, default=7, help='Delete files older than this many days (default: 7)')
-    parser.add_argument('--exclude', type=str, default='Backups', help='Comma-separated list of directories to exclude from cleanup (default: Backups)')
-    
-    args = parser.parse_args()
-    
-    # Find project root if not specified
-    project_root = args.project_root
-    if not project_root:
-        # Try to find it by looking for the tmp directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Go up to Scripts/Tools, then up to project root
-        project_root = os.path.normpath(os.path.join(current_dir, '..', '..', '..'))
-        
-        if not os.path.exists(os.path.join(project_root, 'tmp')):
-            print("Error: Could not find project root directory. Please specify with --project-root")
-            return 1
-    
-    exclude_dirs = [dir.strip() for dir in args.exclude.split(',')]
-    
-    cleanup_tmp_directory(project_root, args.dry_run, args.age, exclude_dirs)
-    return 0
-
-if __name__ == "__main__":
-    sys.exit(main())
-'''
-    
-    with open(cleanup_script_path, "w") as f:
-        f.write(cleanup_script_content)
+    gitignore_path = os.path.join(game_dir, ".gitignore")
+    copied_files = [
+        (os.path.join(TEMPLATES_DIR, "tmp_readme.md"), tmp_readme_path),
+        (os.path.join(TEMPLATES_DIR, "cleanup_tmp.py"), cleanup_script_path),
+        (os.path.join(TEMPLATES_DIR, "gitignore.txt"), gitignore_path),
+    ]
+    
+    # Materialize the whole skeleton in one pass: directories first, then every file concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        _make_directories(game_dir, plan_directories(game_name, engine, platforms), executor, seen)
+        list(executor.map(_write_file, *zip(*text_files)))
+        # Scripts/Tools is one of the base directories, so the cleanup script has somewhere to go
+        assert os.path.isdir(cleanup_script_dir), cleanup_script_dir
+        list(executor.map(shutil.copyfile, *zip(*copied_files)))
+        # Top-level descriptions only fill in directories that exist and have none yet
+        list(executor.map(_write_new_file, *zip(*top_level_files)))
     
     # Make the cleanup script executable
     try:
@@ -393,132 +536,80 @@ if __name__ == "__main__":
     except:
         # Skip chmod on systems that don't support it (like Windows)
         pass
-    print(f"Created tmp directory cleanup script: {cleanup_script_path}")
     
-    # Create a version info file
-    version_path = os.path.join(game_dir, "version_info.json")
-    with open(version_path, "w") as f:
-        f.write('{\n')
-        f.write(f'  "name": "{game_name}",\n')
-        f.write('  "version": "0.1.0",\n')
-        f.write('  "status": "development",\n')
-        f.write(f'  "created": "{datetime.datetime.now().isoformat()}",\n')
-        f.write(f'  "engine": "{engine}",\n')
-        f.write(f'  "platforms": {str(platforms).replace("\'", "\"")}\n')
-        f.write('}\n')
-    
-    print(f"Created version info file: {version_path}")
+    if verbose:
+        print("\n".join(f"Created: {dir_path} (with description.txt)" for dir_path in dir_paths))
+    else:
+        print(f"Created {len(dir_paths)} directories (with description.txt) in {game_dir}")
     
-    # Create a basic .gitignore file
-    gitignore_path = os.path.join(game_dir, ".gitignore")
-    with open(gitignore_path, "w") as f:
-        f.write("# Build directories\n")
-        f.write("Build/\n")
-        f.write("tmp/\n\n")
-        f.write("# Temporary files\n")
-        f.write("*.tmp\n")
-        f.write("*.temp\n")
-        f.write("*.bak\n\n")
-        f.write("# OS specific files\n")
-        f.write(".DS_Store\n")
-        f.write("Thumbs.db\n\n")
-        f.write("# IDE specific files\n")
-        f.write(".idea/\n")
-        f.write(".vscode/\n")
-        f.write("*.sublime-project\n")
-        f.write("*.sublime-workspace\n\n")
-        f.write("# Python specific\n")
-        f.write("__pycache__/\n")
-        f.write("*.py[cod]\n")
-        f.write("*$py.class\n")
-        f.write("venv/\n")
-        f.write("env/\n")
-        f.write(".env\n")
+    # Create engine-specific folders for engines that define any
+    if _ENGINE_STRUCTURES.get(engine):
+        engine_folders = create_engine_specific_structure(engine, game_dir, verbose, seen)
+        print(f"Created engine-specific folders for {engine}")
     
+    print(f"Created README file: {readme_path}")
+    print(f"Created tmp directory README file: {tmp_readme_path}")
+    print(f"Created tmp directory cleanup script: {cleanup_script_path}")
+    print(f"Created version info file: {version_path}")
     print(f"Created gitignore file: {gitignore_path}")
     
     return game_dir
 
-def create_engine_specific_structure(engine, game_dir):
+def create_engine_specific_structure(engine, game_dir, verbose=False, seen=None):
     """
     Creates engine-specific directory structure
     
     Args:
         engine (str): Game engine name
         game_dir (str): Game directory root path
+        verbose (bool): Print every created engine-specific entry
+        seen (set): Directories already created, shared with create_game_directory_structure
     
     Returns:
         list: Created engine-specific directories
     """
-    engine_dirs = []
+    from concurrent.futures import ThreadPoolExecutor
     
-    # Define engine specific directory structures
-    engine_structures = {
-        "Unity": {
-            "Assets/Prefabs": "Contains reusable Unity prefab objects.",
-            "Assets/Materials": "Contains Unity material definitions.",
-            "Assets/Scenes": "Contains Unity scene files.",
-            "Assets/Scripts": "Contains C# scripts for Unity.",
-            "Assets/Editor": "Contains Unity editor extensions and scripts.",
-            "Assets/Resources": "Contains assets that need to be accessed via Resources.Load.",
-            "ProjectSettings": "Contains Unity project settings.",
-            "Packages": "Contains Unity package manager configuration.",
-        },
-        "Unreal": {
-            "Content/Blueprints": "Contains Unreal Blueprint assets.",
-            "Content/Materials": "Contains Unreal material definitions.",
-            "Content/Levels": "Contains Unreal level files.",
-            "Content/Characters": "Contains character assets and blueprints.",
-            "Content/UI": "Contains UI assets and widgets.",
-            "Source/[GameName]": "Contains C++ code for the game.",
-            "Config/DefaultEngine.ini": "Contains engine configuration.",
-            "Config/DefaultGame.ini": "Contains game configuration.",
-        },
-        "Godot": {
-            "scenes": "Contains Godot scene files.",
-            "scripts": "Contains GDScript files.",
-            "assets": "Contains game assets for Godot.",
-            "addons": "Contains Godot addons and plugins.",
-            "project.godot": "Godot project configuration file.",
-            "export_presets.cfg": "Godot export configurations.",
-        },
-        "Custom": {
-            # No additional directories for Custom engine
-        }
-    }
+    engine_dirs = []
+    if seen is None:
+        seen = set()
     
     # Get the structure for the specified engine (default to empty if not found)
-    engine_structure = engine_structures.get(engine, {})
+    engine_structure = _ENGINE_STRUCTURES.get(engine, ())
     
-    # Create engine-specific directories
-    for directory, description in engine_structure.items():
+    # Resolve the target paths first so all directories can be created at once
+    game_dir_prefix = game_dir + os.sep
+    entries = []
+    for directory, description, is_file in engine_structure:
         # Convert [GameName] placeholder if needed
         if "[GameName]" in directory:
             game_name = os.path.basename(game_dir)
             directory = directory.replace("[GameName]", game_name)
         
-        dir_path = os.path.join(game_dir, directory)
+        dir_path = game_dir_prefix + directory
         
         # Skip file paths (create parent directories only)
-        if os.path.basename(directory).find('.') != -1:
+        if is_file:
             dir_path = os.path.dirname(dir_path)
-            os.makedirs(dir_path, exist_ok=True)
-            
+        entries.append((directory, description, dir_path, is_file))
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        _make_directories(game_dir, [os.path.dirname(directory) if is_file else directory
+                                     for directory, _, _, is_file in entries], executor, seen)
+    
+    # Create engine-specific files and descriptions
+    for directory, description, dir_path, is_file in entries:
+        if is_file:
             # Create the file with content
-            with open(os.path.join(game_dir, directory), "w") as f:
-                f.write(f"# {directory}\n\n")
-                f.write(f"{description}\n")
+            _write_file(game_dir_prefix + directory, f"# {directory}\n\n{description}\n")
         else:
-            os.makedirs(dir_path, exist_ok=True)
-            
             # Create a description.txt file in each directory
-            desc_path = os.path.join(dir_path, "description.txt")
-            with open(desc_path, "w") as f:
-                f.write(f"# {directory}\n\n")
-                f.write(f"{description}\n")
+            desc_path = dir_path + os.sep + "description.txt"
+            _write_file(desc_path, f"# {directory}\n\n{description}\n")
         
         engine_dirs.append(directory)
-        print(f"Created engine-specific: {dir_path}")
+        if verbose:
+            print(f"Created engine-specific: {dir_path}")
     
     return engine_dirs
 
@@ -526,87 +617,87 @@ def show_examples():
     """
     Print usage examples for the tool
     """
-    print("\nUsage Examples:")
-    print("=" * 80)
-    print("1. Basic usage (interactive):")
-    print("   python game-project-directory-creator.py")
-    print("")
-    print("2. Basic usage with command-line arguments:")
-    print("   python game-project-directory-creator.py --game-name \"My Awesome Game\" --root-dir \"C:\\Projects\"")
-    print("")
-    print("3. Specify game engine:")
-    print("   python game-project-directory-creator.py --game-name \"My Unity Game\" --engine Unity")
-    print("")
-    print("4. Specify target platforms:")
-    print("   python game-project-directory-creator.py --game-name \"Mobile Game\" --platforms Windows,Android,iOS")
-    print("")
-    print("5. Full example with all parameters:")
-    print("   python game-project-directory-creator.py --game-name \"Space Adventure\" --root-dir \"D:\\Games\" --engine Unreal --platforms Windows,PlayStation,Xbox")
-    print("")
-    print("6. Create a project and then use the cleanup script:")
-    print("   python game-project-directory-creator.py --game-name \"My Game\"")
-    print("   python Scripts/Tools/cleanup_tmp.py --age 30")
-    print("=" * 80)
-    
-    print("\nDirectory Structure Overview:")
-    print("=" * 80)
-    print("The generated directory structure includes:")
-    print("")
-    print("1. Production Pipeline Directories:")
-    print("   - Pre-Production: Idea, Story, Characters, Storyboard, etc.")
-    print("   - Production: Modeling, Animation, Texturing, Lighting, etc.")
-    print("   - Post-Production: Compositing, Color Correction, Final Output, etc.")
-    print("")
-    print("2. Development Structure:")
-    print("   - Source code, assets, documentation, and other standard directories")
-    print("   - Engine-specific directories based on the chosen game engine")
-    print("   - Platform-specific build directories")
-    print("")
-    print("3. Temporary Files:")
-    print("   - Comprehensive tmp directory structure for all temporary assets")
-    print("   - Includes specialized directories for media, renders, and workflow")
-    print("   - Comes with cleanup script for managing temporary files")
-    print("=" * 80)
+    sys.stdout.write(_EXAMPLES_TEXT)
 
-def main():
-    """
-    Main function to run the tool from command line
+def _build_parser():
     """
-    # Define available engines
-    available_engines = ["Custom", "Unity", "Unreal", "Godot"]
+    Builds the argument parser used for --help and for reporting invalid arguments
     
-    # Define available platforms
-    available_platforms = ["Windows", "MacOS", "Linux", "Android", "iOS", "PlayStation", "Xbox", "Nintendo", "Web"]
+    Returns:
+        argparse.ArgumentParser: The command line parser
+    """
+    import argparse
     
-    # Create argument parser for command line usage
     parser = argparse.ArgumentParser(description="Create a template directory structure for game development")
     parser.add_argument("--game-name", help="Name of the game")
     parser.add_argument("--root-dir", help="Root directory where the game structure will be created")
-    parser.add_argument("--engine", choices=available_engines, default="Custom", help=f"Game engine to use: {', '.join(available_engines)}")
-    parser.add_argument("--platforms", help=f"Comma-separated list of target platforms (available: {', '.join(available_platforms)})")
+    parser.add_argument("--engine", choices=ENGINE_CHOICES, default="Custom", help=f"Game engine to use: {_ENGINES_HELP}")
+    parser.add_argument("--platforms", help=f"Comma-separated list of target platforms (available: {_PLATFORMS_HELP})")
     parser.add_argument("--examples", action="store_true", help="Show usage examples and exit")
-    
-    args = parser.parse_args()
+    parser.add_argument("--verbose", action="store_true", help="Print every created directory")
+    return parser
 
-def main():
+def _parse_args(argv):
     """
-    Main function to run the tool from command line
+    Parses the command line arguments without importing argparse in the common case
+    
+    Anything the fast path does not handle (help, unknown or abbreviated options,
+    missing values, invalid engines) is passed on to argparse, so help and error
+    messages are the same as before.
+    
+    Args:
+        argv (list): Command line arguments, without the program name
+    
+    Returns:
+        SimpleNamespace: Parsed options (game_name, root_dir, engine, platforms, examples, verbose)
     """
-    # Define available engines
-    available_engines = ["Custom", "Unity", "Unreal", "Godot"]
+    value_options = {"--game-name": "game_name", "--root-dir": "root_dir", "--engine": "engine", "--platforms": "platforms"}
+    flag_options = {"--examples": "examples", "--verbose": "verbose"}
+    args = SimpleNamespace(game_name=None, root_dir=None, engine="Custom", platforms=None, examples=False, verbose=False)
+    
+    i = 0
+    while i < len(argv):
+        option, has_value, value = argv[i].partition("=")
+        if option in value_options:
+            if not has_value:
+                i += 1
+                if i == len(argv) or argv[i].startswith("-"):
+                    break
+                value = argv[i]
+            setattr(args, value_options[option], value)
+        elif option in flag_options and not has_value:
+            setattr(args, flag_options[option], True)
+        else:
+            break
+        i += 1
+    else:
+        if args.engine in _AVAILABLE_ENGINES:
+            return args
     
-    # Define available platforms
-    available_platforms = ["Windows", "MacOS", "Linux", "Android", "iOS", "PlayStation", "Xbox", "Nintendo", "Web"]
+    return _build_parser().parse_args(argv)
+
+def _prompt(label, default=""):
+    """
+    Asks the user for a value on the terminal
     
-    # Create argument parser for command line usage
-    parser = argparse.ArgumentParser(description="Create a template directory structure for game development")
-    parser.add_argument("--game-name", help="Name of the game")
-    parser.add_argument("--root-dir", help="Root directory where the game structure will be created")
-    parser.add_argument("--engine", choices=available_engines, default="Custom", help=f"Game engine to use: {', '.join(available_engines)}")
-    parser.add_argument("--platforms", help=f"Comma-separated list of target platforms (available: {', '.join(available_platforms)})")
-    parser.add_argument("--examples", action="store_true", help="Show usage examples and exit")
+    Args:
+        label (str): Prompt text, written in a single call
+        default (str): Value returned when the answer is empty or input has ended
     
-    args = parser.parse_args()
+    Returns:
+        str: The answer without its line ending, or the default
+    """
+    sys.stdout.write(label)
+    sys.stdout.flush()
+    answer = sys.stdin.readline().rstrip("\r\n")
+    return answer or default
+
+def main():
+    """
+    Main function to run the tool from command line
+    """
+    # Parse the command line arguments
+    args = _parse_args(sys.argv[1:])
     
     # Show examples if requested
     if args.examples:
@@ -621,57 +712,56 @@ def main():
     engine = args.engine
     platforms_str = args.platforms
     
+    # Without a terminal there is nobody to answer the prompts
+    interactive = sys.stdin.isatty()
+    if not interactive and (not game_name or not root_dir):
+        print("Error: non-interactive mode requires --game-name and --root-dir")
+        return 2
+    
     if not game_name:
-        game_name = input("Enter the name of your game: ")
+        game_name = _prompt("Enter the name of your game: ")
     
     if not root_dir:
-        root_dir = input("Enter the root directory for your game project (leave empty for script directory): ")
-        
-        # Use script directory if none provided
-        if not root_dir:
-            # Get the directory where the script is located
-            root_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    if not engine or engine not in available_engines:
-        print(f"Available engines: {', '.join(available_engines)}")
-        engine = input(f"Select a game engine ({', '.join(available_engines)}) [default: Custom]: ")
-        if not engine or engine not in available_engines:
+        # Use the directory where the script is located if none provided
+        root_dir = _prompt("Enter the root directory for your game project (leave empty for script directory): ", _SCRIPT_DIR)
+    
+    if not engine or engine not in _AVAILABLE_ENGINES:
+        engine = _prompt(f"Available engines: {_ENGINES_HELP}\n"
+                         f"Select a game engine ({_ENGINES_HELP}) [default: Custom]: ", "Custom")
+        if engine not in _AVAILABLE_ENGINES:
             engine = "Custom"
     
-    if not platforms_str:
-        platforms_str = input(f"Enter target platforms (comma-separated) [default: Windows,MacOS,Linux]: ")
+    if not platforms_str and interactive:
+        platforms_str = _prompt(f"Enter target platforms (comma-separated) [default: Windows,MacOS,Linux]: ")
     
-    # Process platforms
-    if platforms_str:
-        platforms = [p.strip() for p in platforms_str.split(",")]
+    # Process platforms, ignoring empty entries such as a trailing comma
+    platforms = tuple(filter(None, map(str.strip, (platforms_str or "").split(","))))
+    if platforms:
         # Validate platforms
         for platform in platforms:
-            if platform not in available_platforms:
-                print(f"Warning: Unknown platform '{platform}'. Available platforms: {', '.join(available_platforms)}")
+            if platform not in _AVAILABLE_PLATFORMS:
+                print(f"Warning: Unknown platform '{platform}'. Available platforms: {_PLATFORMS_HELP}")
     else:
-        platforms = ["Windows", "MacOS", "Linux"]
+        platforms = ("Windows", "MacOS", "Linux")
     
     # Validate inputs
     if not game_name:
         print("Error: Game name cannot be empty.")
         return 1
     
-    # Ensure root directory exists
-    if not os.path.exists(root_dir):
-        create_dir = input(f"The directory {root_dir} does not exist. Create it? (y/n): ")
-        if create_dir.lower() == 'y':
-            try:
-                os.makedirs(root_dir, exist_ok=True)
-            except Exception as e:
-                print(f"Error creating directory: {e}")
-                return 1
-        else:
+    # Confirm a missing root directory; it is created along with the game directory
+    if not os.access(root_dir, os.F_OK):
+        if not interactive:
+            print(f"Error: the directory {root_dir} does not exist")
+            return 2
+        create_dir = _prompt(f"The directory {root_dir} does not exist. Create it? (y/n): ")
+        if create_dir.lower() != 'y':
             print("Operation cancelled.")
             return 0
     
     # Create the game directory structure
     try:
-        game_dir = create_game_directory_structure(game_name, root_dir, engine, platforms)
+        game_dir = create_game_directory_structure(game_name, root_dir, engine, platforms, args.verbose)
         print(f"\nGame directory structure created successfully at: {game_dir}")
         print(f"You can now start developing {game_name}!")
         print(f"- Engine: {engine}")